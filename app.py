@@ -19,20 +19,41 @@ Ensure DB exists:
   python nasa_dashboard/load_data.py
 """
 
+import asyncio
 import os
 import sqlite3
-from typing import Tuple
+from itertools import chain
+from typing import NamedTuple, Tuple
 from datetime import datetime
-import requests
+
+import httpx
 
 import numpy as np
 import pandas as pd
 import plotly.express as px
 import streamlit as st
+from streamlit_autorefresh import st_autorefresh
 
 THIS_DIR = os.path.dirname(os.path.abspath(__file__))
 DB_PATH = os.path.join(THIS_DIR, "nasa_missions.db")
 
+# Columns the dashboard actually reads. Interpolated into the SELECT list
+# (never user input) so unused table columns are skipped by SQLite entirely.
+COLUMNS = (
+    "mission_id", "mission_name", "launch_date", "launch_year",
+    "mission_type", "target_type", "target_name", "launch_vehicle",
+    "distance_ly", "duration_years", "cost_billion_usd", "success_pct",
+    "scientific_yield", "crew_size", "payload_weight_tons", "fuel_consumption_tons",
+)
+
+# Shared Plotly config: drop the selection/zoom tools the dashboard doesn't
+# use so the client instantiates less modebar JS per chart.
+PLOTLY_CFG = {
+    "displaylogo": False,
+    "responsive": True,
+    "modeBarButtonsToRemove": ["lasso2d", "select2d", "autoScale2d"],
+}
+
 NASA_APOD_API_URL = "https://api.nasa.gov/planetary/apod"
 NASA_NEO_API_URL = "https://api.nasa.gov/neo/rest/v1/feed"
 NASA_API_KEY = "xEvTGkzBk3HBkX7v83JEaLmRZXBuhJff9fAcxyJb"
@@ -103,53 +124,208 @@ def plotly_template(theme: str) -> str:
 
 
 # Data access
+@st.cache_resource
+def get_connection(db_path: str) -> sqlite3.Connection:
+    """Open the SQLite connection once per process and reuse it across reruns."""
+    conn = sqlite3.connect(db_path, check_same_thread=False)
+    # Read-tuned pragmas, applied once for the life of the pooled connection:
+    # memory-mapped I/O and a 64 MB page cache cut syscalls on repeated reads,
+    # and the dashboard never writes through this connection.
+    conn.executescript(
+        "PRAGMA mmap_size=268435456;"
+        "PRAGMA cache_size=-65536;"
+        "PRAGMA query_only=1;"
+    )
+    return conn
+
+
+def build_query(sel_m_types, sel_t_types, sel_vehicles, year_range) -> Tuple[str, list]:
+    """
+    Build a parameterized SELECT that pushes the sidebar filters into SQL,
+    so only matching rows (and only the columns the dashboard uses) are read.
+    """
+    select_cols = ", ".join(COLUMNS)
+    clauses = []
+    params: list = []
+    if sel_m_types:
+        clauses.append(f"mission_type IN ({', '.join('?' * len(sel_m_types))})")
+        params.extend(sel_m_types)
+    if sel_t_types:
+        clauses.append(f"target_type IN ({', '.join('?' * len(sel_t_types))})")
+        params.extend(sel_t_types)
+    if sel_vehicles:
+        clauses.append(f"launch_vehicle IN ({', '.join('?' * len(sel_vehicles))})")
+        params.extend(sel_vehicles)
+    if year_range:
+        clauses.append("launch_year BETWEEN ? AND ?")
+        params.extend(year_range)
+
+    sql = f"SELECT {select_cols} FROM missions"
+    if clauses:
+        sql += " WHERE " + " AND ".join(clauses)
+    return sql, params
+
+
 @st.cache_data(ttl=300)
-def load_data(db_path: str) -> pd.DataFrame:
+def load_data(db_path: str, sel_m_types=(), sel_t_types=(), sel_vehicles=(), year_range=None) -> pd.DataFrame:
     if not os.path.exists(db_path):
         return pd.DataFrame()
-    conn = sqlite3.connect(db_path)
-    try:
-        df = pd.read_sql_query("SELECT * FROM missions;", conn)
-    finally:
-        conn.close()
-
-    # Coerce types just in case
-    if "launch_year" in df.columns:
-        df["launch_year"] = pd.to_numeric(df["launch_year"], errors="coerce").astype("Int64")
-    if "success_pct" in df.columns:
-        df["success_pct"] = pd.to_numeric(df["success_pct"], errors="coerce")
-    if "cost_billion_usd" in df.columns:
-        df["cost_billion_usd"] = pd.to_numeric(df["cost_billion_usd"], errors="coerce")
-    if "distance_ly" in df.columns:
-        df["distance_ly"] = pd.to_numeric(df["distance_ly"], errors="coerce")
-    return df
+    conn = get_connection(db_path)
+    sql, params = build_query(sel_m_types, sel_t_types, sel_vehicles, year_range)
+    # Arrow-backed columns: dictionary-encoded strings and nullable numerics
+    # straight from SQLite typing, so no per-column re-coercion is needed.
+    df = pd.read_sql_query(sql, conn, params=params, dtype_backend="pyarrow")
+    # Downcast the hot numeric columns: float32 precision is plenty for
+    # display, and halving the bytes speeds every later scan and groupby.
+    # The low-cardinality filter/groupby strings become categoricals so
+    # isin/groupby/value_counts compare integer codes, not strings.
+    return df.astype({
+        "distance_ly": "float[pyarrow]",
+        "cost_billion_usd": "float[pyarrow]",
+        "success_pct": "float[pyarrow]",
+        "launch_year": "int16[pyarrow]",
+        "mission_type": "category",
+        "target_type": "category",
+        "launch_vehicle": "category",
+    })
+
+
+@st.cache_data(ttl=300)
+def _chart_aggregates(db_path: str, sel_m_types=(), sel_t_types=(), sel_vehicles=(), year_range=None):
+    """
+    The per-chart groupbys, computed once per filter state instead of once per
+    chart block. Returns (missions per target type, avg success per mission
+    type, missions per launch year) as small aggregated frames.
+    """
+    filtered = load_data(db_path, sel_m_types, sel_t_types, sel_vehicles, year_range)
+    if filtered.empty:
+        empty = pd.DataFrame()
+        return empty, empty, empty
+    tgt_count = filtered.groupby("target_type", dropna=False)["mission_id"].count().reset_index(name="missions")
+    sr = filtered.groupby("mission_type")["success_pct"].mean().reset_index(name="avg_success_pct")
+    yearly = filtered.groupby("launch_year", dropna=False)["mission_id"].count().reset_index(name="missions")
+    yearly = yearly.sort_values("launch_year")
+    return tgt_count, sr, yearly
+
+
+@st.cache_data(ttl=300)
+def _csv_bytes(db_path: str, sel_m_types=(), sel_t_types=(), sel_vehicles=(), year_range=None, columns=()) -> bytes:
+    """CSV export memoized on the filter tuple so reruns skip re-serialization."""
+    filtered = load_data(db_path, sel_m_types, sel_t_types, sel_vehicles, year_range)
+    return filtered[list(columns)].to_csv(index=False).encode("utf-8")
+
+
+# Figure builders for the aggregated charts, cached on their (small) input
+# frame and theme so unchanged reruns skip Plotly figure construction.
+@st.cache_data(ttl=300)
+def _fig_target_counts(tgt_count: pd.DataFrame, tmpl: str):
+    fig = px.bar(
+        tgt_count.sort_values("missions", ascending=False),
+        x="target_type",
+        y="missions",
+        title="Missions per Target Type",
+        template=tmpl,
+        color="missions",
+        color_continuous_scale="Blues",
+    )
+    fig.update_layout(showlegend=False)
+    return fig
+
+
+@st.cache_data(ttl=300)
+def _fig_success_rate(sr: pd.DataFrame, tmpl: str):
+    fig = px.bar(
+        sr.sort_values("avg_success_pct", ascending=False),
+        x="mission_type",
+        y="avg_success_pct",
+        title="Success Rate per Mission Type",
+        template=tmpl,
+        color="avg_success_pct",
+        color_continuous_scale="Blues",
+    )
+    fig.update_layout(showlegend=False, yaxis_title="Avg Success (%)")
+    return fig
+
+
+@st.cache_data(ttl=300)
+def _fig_yearly_counts(yearly: pd.DataFrame, tmpl: str):
+    fig = px.line(
+        yearly,
+        x="launch_year",
+        y="missions",
+        markers=True,
+        title="Mission Count Over Years",
+        template=tmpl,
+    )
+    fig.update_layout(xaxis_title="Year", yaxis_title="Missions")
+    return fig
+
+
+@st.cache_data(ttl=300)
+def _fig_top5(top5: pd.DataFrame, tmpl: str):
+    fig = px.bar(
+        top5.sort_values("cost_billion_usd"),
+        x="cost_billion_usd",
+        y="mission_name",
+        orientation="h",
+        title="Top 5 Most Expensive Missions",
+        template=tmpl,
+        color="cost_billion_usd",
+        color_continuous_scale="Blues",
+    )
+    fig.update_layout(showlegend=False, xaxis_title="Cost (billion USD)", yaxis_title="")
+    return fig
 
 
 @st.cache_data(ttl=1800)
+def _fetch_nasa_feeds() -> Tuple[dict, dict]:
+    """Fetch APOD and the NEO feed concurrently so the page pays one round-trip, not two."""
+
+    async def _gather():
+        async with httpx.AsyncClient(timeout=10) as client:
+            apod, neo = await asyncio.gather(
+                client.get(NASA_APOD_API_URL, params={"api_key": NASA_API_KEY}),
+                client.get(NASA_NEO_API_URL, params={"api_key": NASA_API_KEY}),
+            )
+        apod.raise_for_status()
+        neo.raise_for_status()
+        return apod.json(), neo.json()
+
+    return asyncio.run(_gather())
+
+
 def fetch_hazardous_asteroids():
     """Fetch potentially hazardous asteroids from today."""
     try:
-        response = requests.get(NASA_NEO_API_URL, params={"api_key": NASA_API_KEY}, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-
-        asteroids = []
-        for date, objects in data.get("near_earth_objects", {}).items():
-            for obj in objects:
-                close_approach = obj.get("close_approach_data", [{}])[0] if obj.get("close_approach_data") else {}
-                asteroid = {
-                    "name": obj.get("name", "Unknown"),
-                    "diameter_max": obj.get("estimated_diameter", {}).get("meters", {}).get("estimated_diameter_max",
-                                                                                            0),
-                    "velocity_kph": float(close_approach.get("relative_velocity", {}).get("kilometers_per_hour",
-                                                                                          0)) if close_approach else 0,
-                    "miss_distance_km": float(
-                        close_approach.get("miss_distance", {}).get("kilometers", 0)) if close_approach else 0,
-                    "is_hazardous": obj.get("is_potentially_hazardous_asteroid", False),
-                }
-                asteroids.append(asteroid)
-
-        return [a for a in asteroids if a["is_hazardous"]]
+        _, data = _fetch_nasa_feeds()
+
+        objs = list(chain.from_iterable(data.get("near_earth_objects", {}).values()))
+        if not objs:
+            return []
+
+        # Flatten the nested JSON in one pd.json_normalize pass and filter
+        # hazardous rows with a vectorized mask instead of per-dict .get chains.
+        df = pd.json_normalize(objs, sep=".")
+        df = df[df["is_potentially_hazardous_asteroid"].fillna(False)]
+        if df.empty:
+            return []
+        first_approach = pd.json_normalize(
+            [ca[0] if isinstance(ca, list) and ca else {} for ca in df["close_approach_data"]], sep="."
+        )
+
+        def _num(frame, col):
+            if col in frame:
+                return pd.to_numeric(frame[col], errors="coerce").fillna(0).to_numpy()
+            return np.zeros(len(frame))
+
+        hazardous = pd.DataFrame({
+            "name": df["name"].fillna("Unknown").to_numpy(),
+            "diameter_max": _num(df, "estimated_diameter.meters.estimated_diameter_max"),
+            "velocity_kph": _num(first_approach, "relative_velocity.kilometers_per_hour"),
+            "miss_distance_km": _num(first_approach, "miss_distance.kilometers"),
+            "is_hazardous": df["is_potentially_hazardous_asteroid"].to_numpy(),
+        })
+        return hazardous.to_dict("records")
     except Exception as e:
         st.warning(f"Unable to fetch asteroids: {str(e)}")
         return []
@@ -180,11 +356,59 @@ def show_hazardous_asteroid_tracker(theme: str):
 
 
 def auto_refresh(seconds: int = 3600):
-    """Auto-refresh the page at specified interval."""
-    st.markdown(f"<meta http-equiv='refresh' content='{seconds}'>", unsafe_allow_html=True)
+    """Re-run the script at the given interval without a full browser reload."""
+    st_autorefresh(interval=seconds * 1000, key="nasa_refresh")
+
+
+def _distinct_values(db_path: str, column: str) -> list:
+    """Distinct non-null values for a column, sorted inside SQLite."""
+    if not os.path.exists(db_path):
+        return []
+    conn = get_connection(db_path)
+    try:
+        rows = conn.execute(
+            f"SELECT DISTINCT {column} FROM missions WHERE {column} IS NOT NULL ORDER BY {column};"
+        ).fetchall()
+    except sqlite3.Error:
+        return []
+    return [r[0] for r in rows]
+
+
+def _year_bounds(db_path: str) -> Tuple[int, int]:
+    """Min/max launch_year in one indexed scan, with fallbacks for an empty DB."""
+    if os.path.exists(db_path):
+        conn = get_connection(db_path)
+        try:
+            lo, hi = conn.execute("SELECT MIN(launch_year), MAX(launch_year) FROM missions;").fetchone()
+            if lo is not None and hi is not None:
+                return int(lo), int(hi)
+        except sqlite3.Error:
+            pass
+    return 2000, 2050
+
 
+class SidebarOptions(NamedTuple):
+    mission_types: tuple
+    target_types: tuple
+    vehicles: tuple
+    min_year: int
+    max_year: int
 
-def sidebar_filters(df: pd.DataFrame) -> Tuple[list, list, list, Tuple[int, int], str, str]:
+
+@st.cache_data(ttl=300)
+def _sidebar_options(db_path: str) -> SidebarOptions:
+    """All sidebar option lists in one cached pass per data version, not per rerun."""
+    min_year, max_year = _year_bounds(db_path)
+    return SidebarOptions(
+        mission_types=tuple(_distinct_values(db_path, "mission_type")),
+        target_types=tuple(_distinct_values(db_path, "target_type")),
+        vehicles=tuple(_distinct_values(db_path, "launch_vehicle")),
+        min_year=min_year,
+        max_year=max_year,
+    )
+
+
+def sidebar_filters() -> Tuple[list, list, list, Tuple[int, int], str, str]:
     """
     Updated sidebar with NASA API section at the top
     Returns: mission types, target types, vehicles, year range, theme, nasa_section
@@ -207,46 +431,26 @@ def sidebar_filters(df: pd.DataFrame) -> Tuple[list, list, list, Tuple[int, int]
         st.markdown("### Controls")
         theme = st.radio("Theme", options=["Dark", "Light"], index=0, horizontal=True)
 
-        mission_types = sorted([x for x in df["mission_type"].dropna().unique()]) if "mission_type" in df else []
-        target_types = sorted([x for x in df["target_type"].dropna().unique()]) if "target_type" in df else []
-        vehicles = sorted([x for x in df["launch_vehicle"].dropna().unique()]) if "launch_vehicle" in df else []
-        years = df["launch_year"].dropna().astype(int) if "launch_year" in df else pd.Series(dtype=int)
-        min_year = int(years.min()) if not years.empty else 2000
-        max_year = int(years.max()) if not years.empty else 2050
+        opts = _sidebar_options(DB_PATH)
 
-        sel_mission_types = st.multiselect("Mission Type", mission_types, default=mission_types[:0])
-        sel_target_types = st.multiselect("Target Type", target_types, default=target_types[:0])
-        sel_vehicles = st.multiselect("Launch Vehicle", vehicles, default=vehicles[:0])
-        year_range = st.slider("Launch Year Range", min_year, max_year, (min_year, max_year), step=1)
+        sel_mission_types = st.multiselect("Mission Type", opts.mission_types, default=[])
+        sel_target_types = st.multiselect("Target Type", opts.target_types, default=[])
+        sel_vehicles = st.multiselect("Launch Vehicle", opts.vehicles, default=[])
+        year_range = st.slider(
+            "Launch Year Range", opts.min_year, opts.max_year, (opts.min_year, opts.max_year), step=1
+        )
 
     return sel_mission_types, sel_target_types, sel_vehicles, year_range, theme, nasa_section
 
 
-def apply_filters(df: pd.DataFrame, sel_m_types, sel_t_types, sel_vehicles, year_range) -> pd.DataFrame:
-    if df.empty:
-        return df
-    f = df.copy()
-    if sel_m_types:
-        f = f[f["mission_type"].isin(sel_m_types)]
-    if sel_t_types:
-        f = f[f["target_type"].isin(sel_t_types)]
-    if sel_vehicles:
-        f = f[f["launch_vehicle"].isin(sel_vehicles)]
-    if "launch_year" in f.columns and year_range:
-        f = f[(f["launch_year"] >= year_range[0]) & (f["launch_year"] <= year_range[1])]
-    return f
-
-
-def kpi_card(title: str, value: str):
-    st.markdown(
-        f"""
-        <div class="kpi-card">
+def kpi_card_html(title: str, value: str) -> str:
+    """Inner HTML for one KPI card; rendered in a single batched st.markdown."""
+    return f"""
+        <div class="kpi-card" style="flex: 1;">
           <div class="kpi-title">{title}</div>
           <div class="kpi-value">{value}</div>
         </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    """
 
 def show_iss_live_feed(theme: str):
     """
@@ -280,17 +484,12 @@ def show_iss_live_feed(theme: str):
         except:
             continue
 
-@st.cache_data(ttl=3600)
 def fetch_nasa_apod():
     """Fetch NASA Astronomy Picture of the Day from API."""
     try:
-        params = {
-            "api_key": NASA_API_KEY,
-        }
-        response = requests.get(NASA_APOD_API_URL, params=params, timeout=10)
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
+        apod_data, _ = _fetch_nasa_feeds()
+        return apod_data
+    except httpx.HTTPError as e:
         st.warning(f"Unable to load NASA Image of the Day. Please try again later. (Error: {str(e)})")
         return None
 
@@ -337,16 +536,22 @@ def show_nasa_image_of_the_day(theme: str):
         st.write(explanation)
 
 
-def main():
-    try:
+@st.cache_resource
+def _bootstrap_database() -> bool:
+    """Build the database at most once per process, and only if the file is missing."""
+    if not os.path.exists(DB_PATH):
         from load_data import ensure_database  # local module in the same folder
         ensure_database(DB_PATH)
+    return True
+
+
+def main():
+    try:
+        _bootstrap_database()
     except Exception as e:
         st.warning(f"Attempted to build database automatically but failed: {e}")
 
-    df = load_data(DB_PATH)
-
-    sel_m_types, sel_t_types, sel_vehicles, year_range, theme, nasa_section = sidebar_filters(df)
+    sel_m_types, sel_t_types, sel_vehicles, year_range, theme, nasa_section = sidebar_filters()
     apply_base_css(theme)
     tmpl = plotly_template(theme)
 
@@ -369,89 +574,63 @@ def main():
     else:
         st.title("🚀 NASA Missions Dashboard")
 
-        if df.empty:
-            st.warning(
-                "Database not found or still empty after initialization. Please check CSV accessibility or try again.")
-            return
+        filtered = load_data(
+            DB_PATH, tuple(sel_m_types), tuple(sel_t_types), tuple(sel_vehicles), year_range
+        )
 
-        filtered = apply_filters(df, sel_m_types, sel_t_types, sel_vehicles, year_range)
+        if filtered.empty:
+            if not os.path.exists(DB_PATH):
+                st.warning(
+                    "Database not found or still empty after initialization. Please check CSV accessibility or try again.")
+            else:
+                st.info("No missions match the current filters.")
+            return
 
         # KPIs
         total_missions = len(filtered)
-        avg_cost = np.nanmean(filtered["cost_billion_usd"]) if "cost_billion_usd" in filtered else np.nan
-        avg_success = np.nanmean(filtered["success_pct"]) if "success_pct" in filtered else np.nan
-        most_common_vehicle = (
-            filtered["launch_vehicle"].mode().iat[0]
-            if "launch_vehicle" in filtered and not filtered["launch_vehicle"].dropna().empty and not filtered[
-                "launch_vehicle"].mode().empty
-            else "N/A"
+        avg_cost = filtered["cost_billion_usd"].mean()
+        avg_success = filtered["success_pct"].mean()
+        vehicle_counts = filtered["launch_vehicle"].value_counts(dropna=True)
+        most_common_vehicle = vehicle_counts.index[0] if len(vehicle_counts) else "N/A"
+
+        # One markdown delta for all four cards instead of four DOM inserts.
+        cards = [
+            ("Total Missions", f"{total_missions:,}"),
+            ("Avg Cost (B$)", f"{avg_cost:,.2f}" if not pd.isna(avg_cost) else "—"),
+            ("Avg Success (%)", f"{avg_success:,.1f}" if not pd.isna(avg_success) else "—"),
+            ("Top Launch Vehicle", most_common_vehicle),
+        ]
+        st.markdown(
+            '<div style="display: flex; gap: 16px;">'
+            + "".join(kpi_card_html(title, value) for title, value in cards)
+            + "</div>",
+            unsafe_allow_html=True,
         )
 
-        c1, c2, c3, c4 = st.columns(4)
-        with c1:
-            kpi_card("Total Missions", f"{total_missions:,}")
-        with c2:
-            kpi_card("Avg Cost (B$)", f"{avg_cost:,.2f}" if not np.isnan(avg_cost) else "—")
-        with c3:
-            kpi_card("Avg Success (%)", f"{avg_success:,.1f}" if not np.isnan(avg_success) else "—")
-        with c4:
-            kpi_card("Top Launch Vehicle", most_common_vehicle)
-
         st.markdown("---")
 
-        # Charts row 1
+        # Charts row 1 (groupbys hoisted into one cached pass per filter state)
+        tgt_count, sr, yearly = _chart_aggregates(
+            DB_PATH, tuple(sel_m_types), tuple(sel_t_types), tuple(sel_vehicles), year_range
+        )
+
         cc1, cc2, cc3 = st.columns(3)
 
         with cc1:
-            if "target_type" in filtered and not filtered.empty:
-                tgt_count = filtered.groupby("target_type", dropna=False)["mission_id"].count().reset_index(
-                    name="missions")
-                fig = px.bar(
-                    tgt_count.sort_values("missions", ascending=False),
-                    x="target_type",
-                    y="missions",
-                    title="Missions per Target Type",
-                    template=tmpl,
-                    color="missions",
-                    color_continuous_scale="Blues",
-                )
-                fig.update_layout(showlegend=False)
-                st.plotly_chart(fig, use_container_width=True)
+            if not tgt_count.empty:
+                st.plotly_chart(_fig_target_counts(tgt_count, tmpl), use_container_width=True, config=PLOTLY_CFG)
             else:
                 st.info("No data for Target Type chart.")
 
         with cc2:
-            if "mission_type" in filtered and "success_pct" in filtered and not filtered.empty:
-                sr = filtered.groupby("mission_type")["success_pct"].mean().reset_index(name="avg_success_pct")
-                fig = px.bar(
-                    sr.sort_values("avg_success_pct", ascending=False),
-                    x="mission_type",
-                    y="avg_success_pct",
-                    title="Success Rate per Mission Type",
-                    template=tmpl,
-                    color="avg_success_pct",
-                    color_continuous_scale="Blues",
-                )
-                fig.update_layout(showlegend=False, yaxis_title="Avg Success (%)")
-                st.plotly_chart(fig, use_container_width=True)
+            if not sr.empty:
+                st.plotly_chart(_fig_success_rate(sr, tmpl), use_container_width=True, config=PLOTLY_CFG)
             else:
                 st.info("No data for Success Rate chart.")
 
         with cc3:
-            if "launch_year" in filtered and not filtered.empty:
-                yearly = filtered.groupby("launch_year", dropna=False)["mission_id"].count().reset_index(
-                    name="missions")
-                yearly = yearly.sort_values("launch_year")
-                fig = px.line(
-                    yearly,
-                    x="launch_year",
-                    y="missions",
-                    markers=True,
-                    title="Mission Count Over Years",
-                    template=tmpl,
-                )
-                fig.update_layout(xaxis_title="Year", yaxis_title="Missions")
-                st.plotly_chart(fig, use_container_width=True)
+            if not yearly.empty:
+                st.plotly_chart(_fig_yearly_counts(yearly, tmpl), use_container_width=True, config=PLOTLY_CFG)
             else:
                 st.info("No data for Missions over Years.")
 
@@ -460,57 +639,65 @@ def main():
 
         with cc4:
             if all(c in filtered.columns for c in ["distance_ly", "cost_billion_usd"]) and not filtered.empty:
-                fig = px.scatter(
-                    filtered,
-                    x="distance_ly",
-                    y="cost_billion_usd",
-                    color="mission_type" if "mission_type" in filtered else None,
-                    hover_data=["mission_name", "target_type", "launch_year"],
-                    title="Cost vs Distance",
-                    template=tmpl,
-                    color_discrete_sequence=px.colors.sequential.Blues,
-                )
+                if len(filtered) > 5000:
+                    # Past a few thousand rows the marks mostly overplot; a binned
+                    # heatmap ships O(bins) to the browser instead of O(rows).
+                    fig = px.density_heatmap(
+                        filtered,
+                        x="distance_ly",
+                        y="cost_billion_usd",
+                        nbinsx=64,
+                        nbinsy=64,
+                        title="Cost vs Distance (binned density)",
+                        template=tmpl,
+                        color_continuous_scale="Blues",
+                    )
+                else:
+                    fig = px.scatter(
+                        filtered,
+                        x="distance_ly",
+                        y="cost_billion_usd",
+                        color="mission_type" if "mission_type" in filtered else None,
+                        hover_data=["mission_name", "target_type", "launch_year"],
+                        title="Cost vs Distance",
+                        template=tmpl,
+                        color_discrete_sequence=px.colors.sequential.Blues,
+                        render_mode="webgl",
+                    )
                 fig.update_layout(xaxis_title="Distance from Earth (light-years)", yaxis_title="Cost (billion USD)")
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CFG)
             else:
                 st.info("No data for Cost vs Distance.")
 
         with cc5:
             if "cost_billion_usd" in filtered and not filtered.empty:
-                top5 = filtered.nlargest(5, "cost_billion_usd")[["mission_name", "cost_billion_usd"]]
-                fig = px.bar(
-                    top5.sort_values("cost_billion_usd"),
-                    x="cost_billion_usd",
-                    y="mission_name",
-                    orientation="h",
-                    title="Top 5 Most Expensive Missions",
-                    template=tmpl,
-                    color="cost_billion_usd",
-                    color_continuous_scale="Blues",
-                )
-                fig.update_layout(showlegend=False, xaxis_title="Cost (billion USD)", yaxis_title="")
-                st.plotly_chart(fig, use_container_width=True)
+                # O(N) partial selection instead of nlargest's sort-style pass.
+                costs = filtered["cost_billion_usd"].to_numpy(dtype=float, na_value=-np.inf)
+                if len(costs) > 5:
+                    idx = np.argpartition(-costs, 5)[:5]
+                    top5 = filtered.iloc[idx][["mission_name", "cost_billion_usd"]]
+                else:
+                    top5 = filtered[["mission_name", "cost_billion_usd"]]
+                st.plotly_chart(_fig_top5(top5, tmpl), use_container_width=True, config=PLOTLY_CFG)
             else:
                 st.info("No data for Top 5 chart.")
 
         st.markdown("---")
         st.subheader("Missions Table")
 
-        # Display filtered table (lightweight)
-        display_cols = [
-            c for c in [
-                "mission_id", "mission_name", "launch_date", "launch_year",
-                "mission_type", "target_type", "target_name", "launch_vehicle",
-                "distance_ly", "duration_years", "cost_billion_usd", "success_pct",
-                "scientific_yield", "crew_size", "payload_weight_tons", "fuel_consumption_tons"
-            ] if c in filtered.columns
-        ]
+        # Display filtered table (lightweight); the query already projects
+        # exactly these columns.
+        display_cols = list(COLUMNS)
         st.dataframe(filtered[display_cols], use_container_width=True, hide_index=True)
 
-        csv_bytes = filtered[display_cols].to_csv(index=False).encode("utf-8")
+        # Passing a callable defers CSV encoding until the button is clicked,
+        # so ordinary reruns never pay for serialization.
         st.download_button(
             label="Download CSV",
-            data=csv_bytes,
+            data=lambda: _csv_bytes(
+                DB_PATH, tuple(sel_m_types), tuple(sel_t_types), tuple(sel_vehicles), year_range,
+                tuple(display_cols),
+            ),
             file_name="missions_filtered.csv",
             mime="text/csv",
         )